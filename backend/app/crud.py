@@ -1,13 +1,80 @@
 from __future__ import annotations
 
 import json
-from typing import List, Optional
+import threading
+from typing import Dict, Iterable, List, Optional
 
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
 from . import models
 
 
+# Catalog rows are append-only and never renamed, so the id -> name map can be
+# shared across requests and only needs a reload when an unknown id shows up.
+# Every shard has its own catalog ids, so the maps are kept per engine. Maps are
+# replaced rather than mutated so readers on other threads never see a resize,
+# and the lock keeps concurrent reloads from dropping each other's entries.
+# Only committed rows may be cached: reloads happen on the read path, never
+# inside a write transaction that could still roll back.
+_catalog_names: Dict[Engine, Dict[int, str]] = {}
+_catalog_ids: Dict[Engine, Dict[str, int]] = {}
+_catalog_lock = threading.Lock()
+
+
+def _reload_catalog(db: Session) -> Dict[int, str]:
+    bind = db.get_bind()
+    entries = db.query(models.ItemCatalogModel.id, models.ItemCatalogModel.name).all()
+    with _catalog_lock:
+        known_names = dict(_catalog_names.get(bind, {}))
+        known_ids = dict(_catalog_ids.get(bind, {}))
+        for catalog_id, name in entries:
+            known_names[catalog_id] = name
+            known_ids[name] = catalog_id
+        _catalog_names[bind] = known_names
+        _catalog_ids[bind] = known_ids
+    return known_names
+
+
+def get_catalog_names(db: Session, catalog_ids: Iterable[int]) -> Dict[int, str]:
+    names = _catalog_names.get(db.get_bind(), {})
+    if any(catalog_id not in names for catalog_id in catalog_ids):
+        names = _reload_catalog(db)
+    return names
+
+
+def catalog_names_for(db: Session, containers: Iterable[models.ContainerModel]) -> Dict[int, str]:
+    return get_catalog_names(
+        db, {item.catalog_id for container in containers for item in container.items}
+    )
+
+
+def _find_catalog_entry(db: Session, name: str) -> Optional[models.ItemCatalogModel]:
+    return db.query(models.ItemCatalogModel).filter(models.ItemCatalogModel.name == name).first()
+
+
+def intern_item_name(db: Session, name: str) -> int:
+    catalog_id = _catalog_ids.get(db.get_bind(), {}).get(name)
+    if catalog_id is not None:
+        return catalog_id
+
+    # Rows found or inserted here may belong to this still-open transaction, so
+    # they are not cached; the read path picks them up after commit.
+    entry = _find_catalog_entry(db, name)
+    if entry:
+        return entry.id
+
+    try:
+        with db.begin_nested():
+            entry = models.ItemCatalogModel(name=name)
+            db.add(entry)
+    except IntegrityError:
+        # Another request interned the same name between our lookup and insert.
+        entry = _find_catalog_entry(db, name)
+    return entry.id
+
+
 def list_containers(db: Session) -> List[models.ContainerModel]:
     return (
         db.query(models.ContainerModel)
@@ -38,7 +105,7 @@ def create_container(db: Session, qr_code: str, name: str, items: List[dict]):
     for item in items:
         db_item = models.ItemModel(
             container_id=container.id,
-            name=item["name"],
+            catalog_id=intern_item_name(db, item["name"]),
             quantity=item["quantity"],
             details=json.dumps(item["details"]) if item.get("details") else None,
         )
@@ -57,7 +124,7 @@ def update_container(db: Session, container: models.ContainerModel, name: str, i
     for item in items:
         db_item = models.ItemModel(
             container_id=container.id,
-            name=item["name"],
+            catalog_id=intern_item_name(db, item["name"]),
             quantity=item["quantity"],
             details=json.dumps(item["details"]) if item.get("details") else None,
         )
@@ -1,24 +1,115 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple, TypeVar
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_SQLITE_PATH = BASE_DIR / "containers.db"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DEFAULT_SQLITE_PATH}")
+DEFAULT_SHARD = "default"
+
+# DATABASE_SHARDS="north=sqlite:////data/north.db,south=postgresql://..." runs one
+# database per site. SHARD_QR_PREFIXES="N-=north,S-=south" routes QR codes to a
+# site by prefix; unmatched codes go to the first shard. The prefix is the only
+# routing input, so every code has exactly one owning shard.
+DATABASE_SHARDS = os.getenv("DATABASE_SHARDS", "")
+SHARD_QR_PREFIXES = os.getenv("SHARD_QR_PREFIXES", "")
 
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+T = TypeVar("T")
+
+
+@dataclass
+class Shard:
+    name: str
+    engine: Engine
+    session_factory: sessionmaker
+
+
+def parse_pairs(raw: str) -> List[Tuple[str, str]]:
+    pairs: List[Tuple[str, str]] = []
+    for entry in raw.split(","):
+        if not entry.strip():
+            continue
+        key, separator, value = entry.partition("=")
+        key = key.strip()
+        value = value.strip()
+        if not separator or not key or not value:
+            raise ValueError(f"Expected key=value, got '{entry.strip()}'")
+        pairs.append((key, value))
+    return pairs
+
+
+def build_shard(name: str, url: str) -> Shard:
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return Shard(name=name, engine=engine, session_factory=session_factory)
+
+
+shards: Dict[str, Shard] = {
+    name: build_shard(name, url)
+    for name, url in (parse_pairs(DATABASE_SHARDS) or [(DEFAULT_SHARD, DATABASE_URL)])
+}
+default_shard_name = next(iter(shards))
+
+def parse_prefix_routes(raw: str) -> Dict[str, str]:
+    routes = dict(parse_pairs(raw))
+    for prefix, shard_name in routes.items():
+        if shard_name not in shards:
+            raise ValueError(f"QR prefix '{prefix}' routes to unknown shard '{shard_name}'")
+    return routes
+
+
+qr_prefix_routes: Dict[str, str] = parse_prefix_routes(SHARD_QR_PREFIXES)
+
+# Longest prefixes first so "QR12" wins over "QR1".
+_sorted_prefixes = sorted(qr_prefix_routes, key=len, reverse=True)
+
+
+def shard_for_qr(qr_code: str) -> Shard:
+    """Pick the shard that owns ``qr_code``.
+
+    The longest matching QR prefix decides, falling back to the first configured
+    shard.
+    """
+    for prefix in _sorted_prefixes:
+        if qr_code.startswith(prefix):
+            return shards[qr_prefix_routes[prefix]]
+    return shards[default_shard_name]
+
+
+def map_shards(fn: Callable[[Session], T]) -> Iterator[T]:
+    """Run ``fn`` against every shard and yield results in shard order.
+
+    With several shards they are all queried up front on a pool owned by this
+    call; the iterator hands back each result as soon as it and the shards
+    before it have finished. A single shard runs inline on the caller's thread.
+    """
+
+    def run(shard: Shard) -> T:
+        db = shard.session_factory()
+        try:
+            return fn(db)
+        finally:
+            db.close()
+
+    shard_list = list(shards.values())
+    if len(shard_list) == 1:
+        return iter([run(shard_list[0])])
 
-def get_db():
-    db = SessionLocal()
+    executor = ThreadPoolExecutor(max_workers=len(shard_list), thread_name_prefix="shard")
     try:
-        yield db
+        return executor.map(run, shard_list)
     finally:
-        db.close()
+        # Already submitted work keeps running; the threads exit once it is done.
+        executor.shutdown(wait=False)
@@ -2,16 +2,18 @@ from fastapi import Depends, FastAPI, HTTPException, Header, Query
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import csv
 import io
+import itertools
 import json
 import os
 import qrcode
 from sqlalchemy.orm import Session
 
-from .database import Base, engine, get_db, SessionLocal
+from .database import Base, map_shards, shard_for_qr, shards
 from . import models, crud
+from .migrations import migrate_item_catalog
 
 app = FastAPI(title="Container Tracker (Static)")
 
@@ -134,49 +136,53 @@ _initial_containers = [
     ),
 ]
 
-Base.metadata.create_all(bind=engine)
+for shard in shards.values():
+    Base.metadata.create_all(bind=shard.engine)
+    migrate_item_catalog(shard.engine)
 
 
 def seed_initial_data():
-    db = SessionLocal()
-    try:
-        if crud.count_containers(db) == 0:
-            for container in _initial_containers:
-                crud.create_container(
-                    db,
-                    qr_code=container.qr_code,
-                    name=container.name,
-                    items=[
-                        {
-                            "name": item.name,
-                            "quantity": item.quantity,
-                            "details": item.details,
-                        }
-                        for item in container.contents
-                    ],
-                )
-    finally:
-        db.close()
+    if sum(map_shards(crud.count_containers)) > 0:
+        return
+
+    for container in _initial_containers:
+        db = shard_for_qr(container.qr_code).session_factory()
+        try:
+            crud.create_container(
+                db,
+                qr_code=container.qr_code,
+                name=container.name,
+                items=[
+                    {
+                        "name": item.name,
+                        "quantity": item.quantity,
+                        "details": item.details,
+                    }
+                    for item in container.contents
+                ],
+            )
+        finally:
+            db.close()
 
 
 seed_initial_data()
 
 
-def item_model_to_schema(model: models.ItemModel) -> Item:
+def item_model_to_schema(model: models.ItemModel, catalog: Dict[int, str]) -> Item:
     details = None
     if model.details:
         try:
             details = json.loads(model.details)
         except json.JSONDecodeError:
             details = None
-    return Item(name=model.name, quantity=model.quantity, details=details)
+    return Item(name=catalog[model.catalog_id], quantity=model.quantity, details=details)
 
 
-def container_model_to_schema(model: models.ContainerModel) -> Container:
+def container_model_to_schema(model: models.ContainerModel, catalog: Dict[int, str]) -> Container:
     return Container(
         qr_code=model.qr_code,
         name=model.name,
-        contents=[item_model_to_schema(item) for item in model.items],
+        contents=[item_model_to_schema(item, catalog) for item in model.items],
     )
 
 
@@ -187,13 +193,18 @@ def serialized_items_from_container(container: Container) -> List[Dict]:
     ]
 
 
-def matches_search(container: Container, term: str) -> bool:
+def matching_catalog_ids(catalog: Dict[int, str], term: str) -> Set[int]:
+    lowered = term.lower()
+    return {catalog_id for catalog_id, name in catalog.items() if lowered in name.lower()}
+
+
+def matches_search(container: models.ContainerModel, term: str, item_ids: Set[int]) -> bool:
     lowered = term.lower()
     if lowered in container.qr_code.lower() or lowered in container.name.lower():
         return True
 
-    for item in container.contents:
-        if lowered in item.name.lower():
+    for item in container.items:
+        if item.catalog_id in item_ids:
             return True
         quantity_text = str(item.quantity)
         if quantity_text and lowered in quantity_text.lower():
@@ -201,6 +212,27 @@ def matches_search(container: Container, term: str) -> bool:
     return False
 
 
+def load_containers(db: Session, search: Optional[str] = None) -> List[Container]:
+    records = crud.list_containers(db)
+    catalog = crud.catalog_names_for(db, records)
+
+    if search:
+        # Item names are matched once per catalog entry rather than once per row,
+        # and only matching containers are converted to schema objects.
+        item_ids = matching_catalog_ids(catalog, search)
+        records = [record for record in records if matches_search(record, search, item_ids)]
+
+    return [container_model_to_schema(record, catalog) for record in records]
+
+
+def get_container_db(qr_code: str):
+    db = shard_for_qr(qr_code).session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_current_user(
     mock_user_id: Optional[str] = Header(None, alias="X-Mock-User"),
     mock_user_query: Optional[str] = Query(None, alias="mock_user"),
@@ -283,31 +315,50 @@ def parse_item_filters(raw_filters: Optional[List[str]]) -> List[Tuple[str, str]
             raise HTTPException(
                 status_code=400, detail="Filters must be formatted as field:value pairs"
             )
+        if field not in ("name", "quantity") and not field.startswith("detail."):
+            raise HTTPException(
+                status_code=400,
+                detail="Filters support 'name', 'quantity', or 'detail.<key>' fields",
+            )
         parsed.append((field, value))
 
     return parsed
 
 
-def item_matches_filters(item: Item, filters: List[Tuple[str, str]]) -> bool:
+def resolve_name_filters(
+    catalog: Dict[int, str], filters: List[Tuple[str, str]]
+) -> Dict[str, Set[int]]:
+    return {
+        expected: matching_catalog_ids(catalog, expected)
+        for field, expected in filters
+        if field == "name"
+    }
+
+
+def item_matches_filters(
+    item: models.ItemModel,
+    filters: List[Tuple[str, str]],
+    name_matches: Dict[str, Set[int]],
+) -> bool:
+    details: Optional[Dict[str, str]] = None
     for field, expected in filters:
         expected_lower = expected.lower()
         if field == "name":
-            if expected_lower not in item.name.lower():
+            if item.catalog_id not in name_matches[expected]:
                 return False
         elif field == "quantity":
             if str(item.quantity) != expected:
                 return False
-        elif field.startswith("detail."):
+        else:
             key = field.split(".", 1)[1]
-            details = item.details or {}
+            if details is None:
+                try:
+                    details = json.loads(item.details) if item.details else {}
+                except json.JSONDecodeError:
+                    details = {}
             value = details.get(key)
             if value is None or expected_lower not in value.lower():
                 return False
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Filters support 'name', 'quantity', or 'detail.<key>' fields",
-            )
     return True
 
 
@@ -359,16 +410,10 @@ def list_roles(current_user: MockUser = Depends(get_current_user)):
 def list_containers(
     search: Optional[str] = None,
     current_user: MockUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ):
     require_permission(current_user, VIEW_PERMISSION)
-    records = crud.list_containers(db)
-    containers_list = [container_model_to_schema(record) for record in records]
-
-    if search:
-        containers_list = [container for container in containers_list if matches_search(container, search)]
-
-    return containers_list
+    shard_results = map_shards(lambda db: load_containers(db, search))
+    return list(itertools.chain.from_iterable(shard_results))
 
 
 @app.get("/containers/export")
@@ -379,7 +424,6 @@ def export_containers_csv(
     item_filter: Optional[List[str]] = Query(default=None),
     container_qr: Optional[List[str]] = Query(default=None),
     current_user: MockUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ):
     require_permission(current_user, VIEW_PERMISSION)
 
@@ -395,40 +439,55 @@ def export_containers_csv(
     selected_qr_codes = normalize_qr_codes(container_qr)
     selected_qr_set = set(selected_qr_codes)
 
-    prepared_rows: List[Tuple[Container, Optional[Item]]] = []
-    auto_detail_keys: List[str] = []
-    seen_detail_keys = set()
     include_items = bool(resolved_item_fields or normalized_detail_keys or detail_keys_requested)
 
-    records = crud.list_containers(db)
-    containers_list = [container_model_to_schema(record) for record in records]
-    if selected_qr_set:
-        containers_list = [
-            container for container in containers_list if container.qr_code in selected_qr_set
-        ]
-
-    for container in containers_list:
-        contents = list(container.contents or [])
-        if has_filters:
-            matching_items = [item for item in contents if item_matches_filters(item, filters)]
-            if not matching_items:
-                continue
-            row_items: List[Optional[Item]] = matching_items
-        else:
-            row_items = contents or [None]
-
-        if include_items:
-            for item in row_items:
-                prepared_rows.append((container, item))
-                if item and item.details:
-                    for key in item.details.keys():
-                        if key not in seen_detail_keys:
-                            seen_detail_keys.add(key)
-                            auto_detail_keys.append(key)
-        else:
-            prepared_rows.append((container, None))
+    def shard_rows(db: Session) -> List[Tuple[Container, Optional[Item]]]:
+        records = crud.list_containers(db)
+        if selected_qr_set:
+            records = [record for record in records if record.qr_code in selected_qr_set]
+        catalog = crud.catalog_names_for(db, records)
+        name_matches = resolve_name_filters(catalog, filters)
+
+        rows: List[Tuple[Container, Optional[Item]]] = []
+        for record in records:
+            item_models = list(record.items)
+            if has_filters:
+                item_models = [
+                    item for item in item_models if item_matches_filters(item, filters, name_matches)
+                ]
+                if not item_models:
+                    continue
+
+            # Rows only read the container's own fields, so its contents are left empty.
+            container = Container(qr_code=record.qr_code, name=record.name, contents=[])
+            row_items: List[Optional[Item]] = [
+                item_model_to_schema(item, catalog) for item in item_models
+            ] or [None]
+
+            if include_items:
+                rows.extend((container, item) for item in row_items)
+            else:
+                rows.append((container, None))
+        return rows
+
+    # Every shard is read once, in parallel, and all rows are collected before the
+    # response starts so a failing shard surfaces as an error rather than a
+    # truncated CSV.
+    prepared_rows: List[Tuple[Container, Optional[Item]]] = list(
+        itertools.chain.from_iterable(map_shards(shard_rows))
+    )
 
-    selected_detail_keys = normalized_detail_keys if detail_keys_requested else auto_detail_keys
+    if detail_keys_requested:
+        selected_detail_keys = normalized_detail_keys
+    else:
+        selected_detail_keys = []
+        seen_detail_keys = set()
+        for _, item in prepared_rows:
+            if item and item.details:
+                for key in item.details.keys():
+                    if key not in seen_detail_keys:
+                        seen_detail_keys.add(key)
+                        selected_detail_keys.append(key)
 
     header: List[str] = []
     header.extend([f"container_{field}" for field in resolved_container_fields])
@@ -479,13 +538,13 @@ def export_containers_csv(
 def get_container(
     qr_code: str,
     current_user: MockUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_container_db),
 ):
     require_permission(current_user, VIEW_PERMISSION)
     data = crud.get_container_by_qr(db, qr_code)
     if not data:
         raise HTTPException(status_code=404, detail="Container not found")
-    return container_model_to_schema(data)
+    return container_model_to_schema(data, crud.catalog_names_for(db, [data]))
 
 
 @app.put("/containers/{qr_code}", response_model=Container)
@@ -493,7 +552,7 @@ def update_container(
     qr_code: str,
     container: Container,
     current_user: MockUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_container_db),
 ):
     require_permission(current_user, UPDATE_PERMISSION)
     existing = crud.get_container_by_qr(db, qr_code)
@@ -508,14 +567,14 @@ def update_container(
         name=container.name,
         items=serialized_items_from_container(container),
     )
-    return container_model_to_schema(updated)
+    return container_model_to_schema(updated, crud.catalog_names_for(db, [updated]))
 
 
 @app.delete("/containers/{qr_code}", status_code=204)
 def delete_container_endpoint(
     qr_code: str,
     current_user: MockUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_container_db),
 ):
     require_permission(current_user, UPDATE_PERMISSION)
     existing = crud.get_container_by_qr(db, qr_code)
@@ -529,24 +588,28 @@ def delete_container_endpoint(
 def create_container(
     container: Container,
     current_user: MockUser = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ):
     require_permission(current_user, CREATE_PERMISSION)
-    existing = crud.get_container_by_qr(db, container.qr_code)
-    if existing:
-        raise HTTPException(status_code=400, detail="Container with this QR code already exists")
-
-    saved = crud.create_container(
-        db,
-        qr_code=container.qr_code,
-        name=container.name,
-        items=serialized_items_from_container(container),
-    )
-    return container_model_to_schema(saved)
+    # Each QR code has exactly one owning shard, whose unique index keeps codes unique.
+    db = shard_for_qr(container.qr_code).session_factory()
+    try:
+        existing = crud.get_container_by_qr(db, container.qr_code)
+        if existing:
+            raise HTTPException(status_code=400, detail="Container with this QR code already exists")
+
+        saved = crud.create_container(
+            db,
+            qr_code=container.qr_code,
+            name=container.name,
+            items=serialized_items_from_container(container),
+        )
+        return container_model_to_schema(saved, crud.catalog_names_for(db, [saved]))
+    finally:
+        db.close()
 
 
 @app.get("/containers/{qr_code}/qrcode", responses={200: {"content": {"image/png": {}}}})
-def generate_qr(qr_code: str, current_user: MockUser = Depends(get_current_user), db: Session = Depends(get_db)):
+def generate_qr(qr_code: str, current_user: MockUser = Depends(get_current_user), db: Session = Depends(get_container_db)):
     require_permission(current_user, VIEW_PERMISSION)
     existing = crud.get_container_by_qr(db, qr_code)
     if not existing:
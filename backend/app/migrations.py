@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from . import models
+
+
+def migrate_item_catalog(engine: Engine) -> None:
+    """Move free-text item names into the interned ``item_catalog`` table.
+
+    Older databases store ``items.name`` on every row. The distinct names are
+    copied into the catalog, each item is pointed at its entry through
+    ``catalog_id`` and the old column is dropped. Databases already on the new
+    layout are left untouched.
+    """
+    inspector = inspect(engine)
+    if "items" not in inspector.get_table_names():
+        return
+    columns = {column["name"] for column in inspector.get_columns("items")}
+    if "name" not in columns or "catalog_id" in columns:
+        return
+
+    with engine.begin() as conn:
+        models.ItemCatalogModel.__table__.create(conn, checkfirst=True)
+        conn.execute(
+            text(
+                "INSERT INTO item_catalog (name) "
+                "SELECT DISTINCT name FROM items "
+                "WHERE name NOT IN (SELECT name FROM item_catalog)"
+            )
+        )
+        conn.execute(
+            text("ALTER TABLE items ADD COLUMN catalog_id INTEGER REFERENCES item_catalog (id)")
+        )
+        conn.execute(
+            text(
+                "UPDATE items SET catalog_id = "
+                "(SELECT item_catalog.id FROM item_catalog WHERE item_catalog.name = items.name)"
+            )
+        )
+        conn.execute(text("ALTER TABLE items DROP COLUMN name"))
+        if engine.dialect.name == "postgresql":
+            # SQLite cannot add NOT NULL to an existing column; the ORM enforces it there.
+            conn.execute(text("ALTER TABLE items ALTER COLUMN catalog_id SET NOT NULL"))
+        conn.execute(text("CREATE INDEX ix_items_catalog_id ON items (catalog_id)"))
@@ -21,12 +21,19 @@ class ContainerModel(Base):
     )
 
 
+class ItemCatalogModel(Base):
+    __tablename__ = "item_catalog"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+
+
 class ItemModel(Base):
     __tablename__ = "items"
 
     id = Column(Integer, primary_key=True, index=True)
     container_id = Column(Integer, ForeignKey("containers.id", ondelete="CASCADE"), nullable=False)
-    name = Column(String, nullable=False)
+    catalog_id = Column(Integer, ForeignKey("item_catalog.id"), index=True, nullable=False)
     quantity = Column(Integer, nullable=False, default=0)
     details = Column(Text, nullable=True)
 
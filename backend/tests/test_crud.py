@@ -0,0 +1,24 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud
+from app.database import Base
+
+
+def test_rolled_back_catalog_entries_are_not_cached(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    try:
+        first = crud.intern_item_name(db, "Brand New")
+        assert crud.intern_item_name(db, "Brand New") == first
+        db.rollback()
+
+        assert "Brand New" not in crud._catalog_ids.get(engine, {})
+        other = crud.intern_item_name(db, "Other Thing")
+        db.commit()
+        assert crud.get_catalog_names(db, [other])[other] == "Other Thing"
+    finally:
+        db.close()
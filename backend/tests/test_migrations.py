@@ -0,0 +1,64 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.migrations import migrate_item_catalog
+
+LEGACY_SCHEMA = [
+    "CREATE TABLE containers (id INTEGER NOT NULL, qr_code VARCHAR NOT NULL, "
+    "name VARCHAR NOT NULL, PRIMARY KEY (id))",
+    "CREATE TABLE items (id INTEGER NOT NULL, container_id INTEGER NOT NULL, "
+    "name VARCHAR NOT NULL, quantity INTEGER NOT NULL, details TEXT, PRIMARY KEY (id), "
+    "FOREIGN KEY(container_id) REFERENCES containers (id) ON DELETE CASCADE)",
+    "CREATE INDEX ix_items_id ON items (id)",
+]
+
+LEGACY_ITEMS = [
+    (1, 1, "PCR Tubes", 4, None),
+    (2, 1, "Thermal Gloves", 2, '{"size": "M"}'),
+    (3, 2, "PCR Tubes", 1, None),
+    (4, 2, "Parafilm Roll", 1, None),
+]
+
+
+def make_legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO containers VALUES (1, 'QR1', 'Drawer'), (2, 'QR2', 'Rack')"))
+        for row in LEGACY_ITEMS:
+            conn.execute(
+                text("INSERT INTO items VALUES (:id, :container_id, :name, :quantity, :details)"),
+                dict(zip(["id", "container_id", "name", "quantity", "details"], row)),
+            )
+    return engine
+
+
+def test_migration_keeps_item_names(tmp_path):
+    engine = make_legacy_engine(tmp_path)
+
+    migrate_item_catalog(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("items")}
+    assert "name" not in columns
+    assert "catalog_id" in columns
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT items.id, items.container_id, item_catalog.name, items.quantity, items.details "
+                "FROM items JOIN item_catalog ON item_catalog.id = items.catalog_id ORDER BY items.id"
+            )
+        ).all()
+        catalog_names = conn.execute(text("SELECT name FROM item_catalog")).scalars().all()
+    assert [tuple(row) for row in rows] == LEGACY_ITEMS
+    assert sorted(catalog_names) == ["PCR Tubes", "Parafilm Roll", "Thermal Gloves"]
+
+
+def test_migration_is_a_no_op_when_already_migrated(tmp_path):
+    engine = make_legacy_engine(tmp_path)
+    migrate_item_catalog(engine)
+
+    migrate_item_catalog(engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM item_catalog")).scalar() == 3
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == len(LEGACY_ITEMS)
@@ -0,0 +1,87 @@
+import importlib
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+
+def _forget_app_modules():
+    for name in [name for name in sys.modules if name == "app" or name.startswith("app.")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def sharded(tmp_path, monkeypatch):
+    # Shards are configured at import time, so the app is imported fresh with
+    # two SQLite shards and dropped again afterwards.
+    monkeypatch.setenv(
+        "DATABASE_SHARDS",
+        f"north=sqlite:///{tmp_path / 'north.db'},south=sqlite:///{tmp_path / 'south.db'}",
+    )
+    monkeypatch.setenv("SHARD_QR_PREFIXES", "S-=south")
+    _forget_app_modules()
+    main = importlib.import_module("app.main")
+    database = importlib.import_module("app.database")
+    yield TestClient(main.app), database
+    _forget_app_modules()
+
+
+def stored_qr_codes(database, shard_name):
+    db = database.shards[shard_name].session_factory()
+    try:
+        return sorted(db.execute(text("SELECT qr_code FROM containers")).scalars())
+    finally:
+        db.close()
+
+
+def test_routes_by_qr_prefix(sharded):
+    client, database = sharded
+    response = client.post(
+        "/containers",
+        json={"qr_code": "S-1", "name": "South box", "contents": [{"name": "PCR Tubes", "quantity": 3}]},
+    )
+    assert response.status_code == 201
+
+    assert database.shard_for_qr("S-1").name == "south"
+    assert database.shard_for_qr("Z9").name == "north"
+    assert stored_qr_codes(database, "south") == ["S-1"]
+    assert stored_qr_codes(database, "north") == ["QR123", "QR456"]
+    assert client.get("/containers/S-1").json()["name"] == "South box"
+
+    duplicate = client.post("/containers", json={"qr_code": "S-1", "name": "Again", "contents": []})
+    assert duplicate.status_code == 400
+
+
+def test_list_and_search_merge_all_shards(sharded):
+    client, _ = sharded
+    client.post(
+        "/containers",
+        json={"qr_code": "S-1", "name": "South box", "contents": [{"name": "PCR Tubes", "quantity": 3}]},
+    )
+
+    listed = [container["qr_code"] for container in client.get("/containers").json()]
+    assert listed == ["QR123", "QR456", "S-1"]
+
+    found = [container["qr_code"] for container in client.get("/containers", params={"search": "pcr"}).json()]
+    assert found == ["QR456", "S-1"]
+
+
+def test_export_merges_header_and_rows_across_shards(sharded):
+    client, _ = sharded
+    client.post(
+        "/containers",
+        json={
+            "qr_code": "S-1",
+            "name": "South box",
+            "contents": [{"name": "PCR Tubes", "quantity": 3, "details": {"lot": "7"}}],
+        },
+    )
+
+    response = client.get("/containers/export", params={"item_filter": "name:pcr"})
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "container_qr_code,container_name,item_name,item_quantity,detail_lot",
+        "QR456,Blue Storage Drawer,PCR Tubes,4,",
+        "S-1,South box,PCR Tubes,3,7",
+    ]